@@ -0,0 +1,14 @@
+import logging
+
+from meal_max.utils.logger import configure_logger
+
+
+# Configure the package-root logger exactly once. Module loggers under the
+# "meal_max" namespace inherit its handlers through the logging hierarchy,
+# so the individual modules no longer run handler setup at import time.
+# The flag keeps a reload of this module from stacking duplicate handlers.
+_configured = False
+
+if not _configured:
+    configure_logger(logging.getLogger("meal_max"))
+    _configured = True
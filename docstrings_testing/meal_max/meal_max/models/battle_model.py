@@ -1,13 +1,15 @@
 import logging
 from typing import List
 
-from meal_max.models.kitchen_model import Meal, update_meal_stats
-from meal_max.utils.logger import configure_logger
+from meal_max.models.kitchen_model import Meal, update_meal_stats_pair
 from meal_max.utils.random_utils import get_random
 
 
 logger = logging.getLogger(__name__)
-configure_logger(logger)
+
+# Reciprocal of the score-delta normalization divisor; multiplying by a
+# constant is cheaper than dividing on every battle.
+_INV_100: float = 0.01
 
 
 class BattleModel:
@@ -19,11 +21,17 @@ class BattleModel:
     factors like the meal's price, cuisine, difficulty, and a random number 
     generator.
     """
-     
+
+    # A battle never holds more than two combatants, so they live in two
+    # fixed slots plus a count instead of a list; __slots__ keeps the
+    # model itself free of a per-instance __dict__.
+    __slots__ = ('_c0', '_c1', '_n')
 
     def __init__(self):
-        """Initializes an empty list of combatants for the battle."""
-        self.combatants: List[Meal] = []
+        """Initializes the two empty combatant slots for the battle."""
+        self._c0: Meal = None
+        self._c1: Meal = None
+        self._n: int = 0
 
     def battle(self) -> str:
         """Simulates a battle between two combatants and determines the winner.
@@ -38,62 +46,81 @@ class BattleModel:
         Raises:
             ValueError: If there are fewer than two combatants available.
         """
-        logger.info("Two meals enter, one meal leaves!")
+        # Checking the level once up front lets us skip all INFO logging work
+        # (argument evaluation and handler dispatch) when INFO is filtered out;
+        # under `python -O` the `__debug__` guards are stripped entirely.
+        _info_on = __debug__ and logger.isEnabledFor(logging.INFO)
+
+        # Bind the hot-path callables to locals so each call site is a fast
+        # local load instead of a module/attribute dict probe.
+        info = logger.info
+        rand = get_random
+        update_stats = update_meal_stats_pair
 
-        if len(self.combatants) < 2:
+        if _info_on:
+            info("Two meals enter, one meal leaves!")
+
+        if self._n < 2:
             logger.error("Not enough combatants to start a battle.")
             raise ValueError("Two combatants must be prepped for a battle.")
 
-        combatant_1 = self.combatants[0]
-        combatant_2 = self.combatants[1]
+        combatant_1 = self._c0
+        combatant_2 = self._c1
 
         # Log the start of the battle
-        logger.info("Battle started between %s and %s", combatant_1.meal, combatant_2.meal)
+        if _info_on:
+            info("Battle started between %s and %s", combatant_1.meal, combatant_2.meal)
 
         # Get battle scores for both combatants
         score_1 = self.get_battle_score(combatant_1)
         score_2 = self.get_battle_score(combatant_2)
 
         # Log the scores for both combatants
-        logger.info("Score for %s: %.3f", combatant_1.meal, score_1)
-        logger.info("Score for %s: %.3f", combatant_2.meal, score_2)
+        if _info_on:
+            info("Score for %s: %.3f", combatant_1.meal, score_1)
+            info("Score for %s: %.3f", combatant_2.meal, score_2)
 
         # Compute the delta and normalize between 0 and 1
-        delta = abs(score_1 - score_2) / 100
+        delta = abs(score_1 - score_2) * _INV_100
 
         # Log the delta and normalized delta
-        logger.info("Delta between scores: %.3f", delta)
+        if _info_on:
+            info("Delta between scores: %.3f", delta)
 
         # Get random number from random.org
-        random_number = get_random()
+        random_number = rand()
 
         # Log the random number
-        logger.info("Random number from random.org: %.3f", random_number)
+        if _info_on:
+            info("Random number from random.org: %.3f", random_number)
 
-        # Determine the winner based on the normalized delta
-        if delta > random_number:
-            winner = combatant_1
-            loser = combatant_2
-        else:
-            winner = combatant_2
-            loser = combatant_1
+        # Determine the winner based on the normalized delta, selecting by
+        # index instead of branching: 0 -> combatant_1 wins, 1 -> combatant_2
+        idx = int(delta <= random_number)
+        pair = (combatant_1, combatant_2)
+        winner, loser = pair[idx], pair[1 - idx]
 
         # Log the winner
-        logger.info("The winner is: %s", winner.meal)
+        if _info_on:
+            info("The winner is: %s", winner.meal)
 
-        # Update stats for both combatants
-        update_meal_stats(winner.id, 'win')
-        update_meal_stats(loser.id, 'loss')
+        # Update stats for both combatants in one round-trip
+        update_stats(winner.id, loser.id)
 
-        # Remove the losing combatant from combatants
-        self.combatants.remove(loser)
+        # Keep the winner in the first slot and drop the loser
+        self._c0 = winner
+        self._c1 = None
+        self._n = 1
 
         return winner.meal
 
     def clear_combatants(self):
-        """Clears the list of combatants, preparing for a new battle."""
-        logger.info("Clearing the combatants list.")
-        self.combatants.clear()
+        """Clears the combatant slots, preparing for a new battle."""
+        if __debug__ and logger.isEnabledFor(logging.INFO):
+            logger.info("Clearing the combatants list.")
+        self._c0 = None
+        self._c1 = None
+        self._n = 0
 
     def get_battle_score(self, combatant: Meal) -> float:
         """Calculates the battle score for a given combatant based on its attributes.
@@ -104,17 +131,20 @@ class BattleModel:
         Returns:
             float: The calculated battle score.
         """
-        difficulty_modifier = {"HIGH": 1, "MED": 2, "LOW": 3}
+        # Skip INFO logging work entirely when the level is filtered out.
+        _info_on = __debug__ and logger.isEnabledFor(logging.INFO)
 
         # Log the calculation process
-        logger.info("Calculating battle score for %s: price=%.3f, cuisine=%s, difficulty=%s",
-                    combatant.meal, combatant.price, combatant.cuisine, combatant.difficulty)
+        if _info_on:
+            logger.info("Calculating battle score for %s: price=%.3f, cuisine=%s, difficulty=%s",
+                        combatant.meal, combatant.price, combatant.cuisine, combatant.difficulty)
 
-        # Calculate score
-        score = (combatant.price * len(combatant.cuisine)) - difficulty_modifier[combatant.difficulty]
+        # Calculate score from the attributes cached on the Meal at construction
+        score = (combatant.price * combatant.cuisine_len) - combatant.difficulty_code
 
         # Log the calculated score
-        logger.info("Battle score for %s: %.3f", combatant.meal, score)
+        if _info_on:
+            logger.info("Battle score for %s: %.3f", combatant.meal, score)
 
         return score
 
@@ -124,8 +154,9 @@ class BattleModel:
         Returns:
             List[Meal]: The list of combatants in the current battle.
         """
-        logger.info("Retrieving current list of combatants.")
-        return self.combatants
+        if __debug__ and logger.isEnabledFor(logging.INFO):
+            logger.info("Retrieving current list of combatants.")
+        return [self._c0, self._c1][:self._n]
 
     def prep_combatant(self, combatant_data: Meal):
         """Prepares a new combatant by adding it to the combatants list.
@@ -136,14 +167,24 @@ class BattleModel:
         Raises:
             ValueError: If there are already two combatants in the battle.
         """
-        if len(self.combatants) >= 2:
-            logger.error("Attempted to add combatant '%s' but combatants list is full", combatant_data.meal)
+        if self._n >= 2:
+            # The raise already reports the failure; only do the logging work
+            # (including the .meal attribute fetch) if ERROR is actually emitted
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Attempted to add combatant '%s' but combatants list is full", combatant_data.meal)
             raise ValueError("Combatant list is full, cannot add more combatants.")
 
         # Log the addition of the combatant
-        logger.info("Adding combatant '%s' to combatants list", combatant_data.meal)
+        if __debug__ and logger.isEnabledFor(logging.INFO):
+            logger.info("Adding combatant '%s' to combatants list", combatant_data.meal)
 
-        self.combatants.append(combatant_data)
+        if self._n == 0:
+            self._c0 = combatant_data
+        else:
+            self._c1 = combatant_data
+        self._n += 1
 
-        # Log the current state of combatants
-        logger.info("Current combatants list: %s", [combatant.meal for combatant in self.combatants])
+        # Log the current state of combatants; the guard keeps the meal-name
+        # list from being built at all when INFO is filtered out
+        if __debug__ and logger.isEnabledFor(logging.INFO):
+            logger.info("Current combatants list: %s", [combatant.meal for combatant in (self._c0, self._c1)[:self._n]])
@@ -5,30 +5,45 @@ import sqlite3
 from typing import Any
 
 from meal_max.utils.sql_utils import get_db_connection
-from meal_max.utils.logger import configure_logger
 
 
 logger = logging.getLogger(__name__)
-configure_logger(logger)
 
 
-@dataclass
+# Integer battle-score modifier for each difficulty level, precomputed on the
+# Meal so the battle hot path never repeats the string lookup.
+_DIFFICULTY_CODE = {"HIGH": 1, "MED": 2, "LOW": 3}
+
+
+@dataclass(frozen=True)
 class Meal:
+    # Slots replace the per-instance __dict__, shrinking each Meal and making
+    # attribute access a fixed-offset load. Declared explicitly because the
+    # deployment image runs Python 3.9, which predates @dataclass(slots=True).
+    __slots__ = ('id', 'meal', 'cuisine', 'price', 'difficulty',
+                 'cuisine_len', 'difficulty_code')
+
     id: int
     meal: str
     cuisine: str
     price: float
     difficulty: str
+    # cuisine_len and difficulty_code are plain slot attributes rather than
+    # dataclass fields (a field() default would clash with __slots__); they
+    # are derived in __post_init__ and cached for the battle hot path.
 
     def __post_init__(self):
         """Validates the Meal object attributes after initialization.
 
         Ensures that the price is positive and the difficulty is one of the allowed values: 'LOW', 'MED', 'HIGH'.
+        Also caches the cuisine length and the numeric difficulty code so battle scoring can use them directly.
         """
         if self.price < 0:
             raise ValueError("Price must be a positive value.")
         if self.difficulty not in ['LOW', 'MED', 'HIGH']:
             raise ValueError("Difficulty must be 'LOW', 'MED', or 'HIGH'.")
+        object.__setattr__(self, 'cuisine_len', len(self.cuisine))
+        object.__setattr__(self, 'difficulty_code', _DIFFICULTY_CODE[self.difficulty])
 
 
 def create_meal(meal: str, cuisine: str, price: float, difficulty: str) -> None:
@@ -241,6 +256,38 @@ def get_meal_by_name(meal_name: str) -> Meal:
         raise e
 
 
+def update_meal_stats_pair(winner_id: int, loser_id: int) -> None:
+    """Updates the battle statistics for both combatants of a battle at once.
+
+    Records one battle for each meal and one win for the winner in a single
+    UPDATE statement, halving the database round-trips per battle compared to
+    calling update_meal_stats twice.
+
+    Args:
+        winner_id: The ID of the winning meal.
+        loser_id: The ID of the losing meal.
+
+    Raises:
+        sqlite3.Error: If there is a database error.
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE meals
+                SET battles = battles + 1,
+                    wins = wins + CASE WHEN id = ? THEN 1 ELSE 0 END
+                WHERE id IN (?, ?) AND deleted = false
+            """, (winner_id, winner_id, loser_id))
+            conn.commit()
+
+            logger.info("Updated stats for battle: meal %s won, meal %s lost", winner_id, loser_id)
+
+    except sqlite3.Error as e:
+        logger.error("Database error: %s", str(e))
+        raise e
+
+
 def update_meal_stats(meal_id: int, result: str) -> None:
     """Updates the battle statistics of a meal.
 
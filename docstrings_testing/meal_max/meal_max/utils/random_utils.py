@@ -1,49 +1,79 @@
+from collections import deque
 import logging
-import requests
+import threading
 
-from meal_max.utils.logger import configure_logger
+import requests
 
 logger = logging.getLogger(__name__)
-configure_logger(logger)
+
+
+# Number of decimal fractions fetched from random.org per request. Batching
+# amortizes the HTTP round-trip across this many get_random() calls.
+_BATCH_SIZE = 1024
+
+# Cache of fetched numbers; the lock only guards the refill so the common
+# cache-hit path stays a plain (thread-safe) deque pop.
+_cache: deque = deque()
+_cache_lock = threading.Lock()
 
 
 def get_random() -> float:
     """
-    Fetches a random int between 1 and the number of songs in the catalog from random.org.
+    Returns a random decimal fraction between 0 and 1 from random.org.
+
+    Numbers are fetched in batches of _BATCH_SIZE per HTTP request and served
+    from an in-memory cache, so only one call per batch pays the network
+    round-trip.
 
     Returns:
         float: The random number fetched from random.org.
 
     Raises:
         RuntimeError: If the request to random.org fails or returns an invalid response.
-        ValueError: If the response from random.org is not a valid float.
+        ValueError: If the response from random.org is not a valid list of floats.
     """
-    
-    url = "https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new"
-
     try:
-        # Log the request to random.org
-        logger.info("Fetching random number from %s", url)
-
-        response = requests.get(url, timeout=5)
+        return _cache.popleft()
+    except IndexError:
+        pass
 
-        # Check if the request was successful
-        response.raise_for_status()
+    with _cache_lock:
+        # Another thread may have refilled the cache while we waited
+        try:
+            return _cache.popleft()
+        except IndexError:
+            pass
 
-        random_number_str = response.text.strip()
+        url = f"https://www.random.org/decimal-fractions/?num={_BATCH_SIZE}&dec=2&col=1&format=plain&rnd=new"
 
         try:
-            random_number = float(random_number_str)
-        except ValueError:
-            raise ValueError("Invalid response from random.org: %s" % random_number_str)
+            # Log the request to random.org
+            logger.info("Fetching %d random numbers from %s", _BATCH_SIZE, url)
+
+            response = requests.get(url, timeout=5)
+
+            # Check if the request was successful
+            response.raise_for_status()
+
+            random_number_str = response.text.strip()
+
+            try:
+                random_numbers = [float(line) for line in random_number_str.split()]
+            except ValueError:
+                raise ValueError("Invalid response from random.org: %s" % random_number_str)
+
+            if not random_numbers:
+                raise ValueError("Invalid response from random.org: %s" % random_number_str)
+
+            _cache.extend(random_numbers[1:])
 
-        logger.info("Received random number: %.3f", random_number)
-        return random_number
+            logger.info("Received %d random numbers, serving %.3f", len(random_numbers), random_numbers[0])
+            return random_numbers[0]
 
-    except requests.exceptions.Timeout:
-        logger.error("Request to random.org timed out.")
-        raise RuntimeError("Request to random.org timed out.")
+        except requests.exceptions.Timeout:
+            logger.error("Request to random.org timed out.")
+            raise RuntimeError("Request to random.org timed out.")
 
-    except requests.exceptions.RequestException as e:
-        logger.error("Request to random.org failed: %s", e)
-        raise RuntimeError("Request to random.org failed: %s" % e)
+        except requests.exceptions.RequestException as e:
+            logger.error("Request to random.org failed: %s", e)
+            raise RuntimeError("Request to random.org failed: %s" % e)
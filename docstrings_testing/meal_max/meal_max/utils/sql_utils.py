@@ -3,11 +3,8 @@ import logging
 import os
 import sqlite3
 
-from meal_max.utils.logger import configure_logger
-
 
 logger = logging.getLogger(__name__)
-configure_logger(logger)
 
 
 # load the db path from the environment with a default value
@@ -31,7 +31,7 @@ def test_prep_combatant(battle_model, sample_meal1):
     assert len(battle_model.get_combatants()) == 1
     assert battle_model.get_combatants()[0].meal == 'Pizza'
 
-def test_prep_combatant_full_list(battle_model, sample_meal1, sample_meal2):
+def test_prep_combatant_full_list(battle_model, sample_meal1, sample_meal2, sample_meal3):
     """Test attempting to add a combatant when the list is full."""
     battle_model.prep_combatant(sample_meal1)
     battle_model.prep_combatant(sample_meal2)
@@ -51,18 +51,20 @@ def test_battle(battle_model, sample_meal1, sample_meal2, mocker):
     battle_model.prep_combatant(sample_meal2)
     
     # Mocking the random number generation for predictable results
-    mock_get_random = mocker.patch("meal_max.utils.random_utils.get_random", return_value=0.1)
-    mock_update_meal_stats = mocker.patch("meal_max.models.kitchen_model.update_meal_stats")
+    mock_get_random = mocker.patch("meal_max.models.battle_model.get_random", return_value=0.1)
+    mock_update_stats_pair = mocker.patch("meal_max.models.battle_model.update_meal_stats_pair")
 
     # Run battle
     winner = battle_model.battle()
 
     # Assert winner is one of the combatants
-    assert winner in [sample_meal1, sample_meal2]
+    assert winner in [sample_meal1.meal, sample_meal2.meal]
 
-    # Assert stats were updated correctly
-    mock_update_meal_stats.assert_any_call(sample_meal1.id, 'win')
-    mock_update_meal_stats.assert_any_call(sample_meal2.id, 'loss')
+    # Assert stats for both combatants were updated in a single call
+    winner_meal, loser_meal = (
+        (sample_meal1, sample_meal2) if winner == sample_meal1.meal else (sample_meal2, sample_meal1)
+    )
+    mock_update_stats_pair.assert_called_once_with(winner_meal.id, loser_meal.id)
 
 def test_clear_combatants(battle_model, sample_meal1, sample_meal2):
     """Test clearing the combatants list."""
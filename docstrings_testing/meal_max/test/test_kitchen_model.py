@@ -1,6 +1,23 @@
 import pytest
-from unittest import mock
-from meal_max.models.kitchen_model import Meal, create_meal, delete_meal, get_leaderboard, get_meal_by_id, get_meal_by_name, update_meal_stats, clear_meals
+from meal_max.models.kitchen_model import Meal, create_meal, delete_meal, get_leaderboard, get_meal_by_id, get_meal_by_name, update_meal_stats, update_meal_stats_pair, clear_meals
+
+
+@pytest.fixture(autouse=True)
+def mock_db(mocker):
+    """Patch the database connection once per test with a preconfigured mock.
+
+    Patching kitchen_model's own reference (rather than sql_utils) ensures the
+    module under test actually sees the mock; autouse avoids re-declaring the
+    patch in every test.
+    """
+    return mocker.patch('meal_max.models.kitchen_model.get_db_connection')
+
+
+@pytest.fixture
+def mock_cursor(mock_db):
+    """Shortcut to the cursor object on the mocked connection."""
+    return mock_db.return_value.__enter__.return_value.cursor.return_value
+
 
 @pytest.fixture
 def meal_data():
@@ -18,69 +35,60 @@ def meal():
     return Meal(id=1, meal='Pizza', cuisine='Italian', price=10.0, difficulty='MED')
 
 
-def test_create_meal(meal_data, mocker):
+def test_create_meal(meal_data, mock_cursor):
     """Test creating a meal."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    
     create_meal(**meal_data)
-    
+
     # Ensure that the database insertion was called with the correct values
-    mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.execute.assert_called_once_with(
-        "INSERT INTO meals (meal, cuisine, price, difficulty) VALUES (?, ?, ?, ?)",
-        (meal_data['meal'], meal_data['cuisine'], meal_data['price'], meal_data['difficulty'])
-    )
+    args = mock_cursor.execute.call_args
+    assert " ".join(args[0][0].split()) == "INSERT INTO meals (meal, cuisine, price, difficulty) VALUES (?, ?, ?, ?)"
+    assert args[0][1] == (meal_data['meal'], meal_data['cuisine'], meal_data['price'], meal_data['difficulty'])
 
 
-def test_create_meal_invalid_price(mocker):
+def test_create_meal_invalid_price():
     """Test creating a meal with an invalid price."""
     with pytest.raises(ValueError, match="Invalid price: -1. Price must be a positive number."):
         create_meal('Pizza', 'Italian', -1, 'MED')
 
 
-def test_create_meal_invalid_difficulty(mocker):
+def test_create_meal_invalid_difficulty():
     """Test creating a meal with an invalid difficulty."""
     with pytest.raises(ValueError, match="Invalid difficulty level: INVALID. Must be 'LOW', 'MED', or 'HIGH'."):
         create_meal('Pizza', 'Italian', 10, 'INVALID')
 
 
-def test_delete_meal(meal, mocker):
+def test_delete_meal(meal, mock_cursor):
     """Test deleting a meal."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.fetchone.return_value = (False,)
-    
+    mock_cursor.fetchone.return_value = (False,)
+
     delete_meal(meal.id)
 
     # Ensure that the meal was marked as deleted
-    mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.execute.assert_called_with(
+    mock_cursor.execute.assert_called_with(
         "UPDATE meals SET deleted = TRUE WHERE id = ?", (meal.id,)
     )
 
 
-def test_delete_meal_not_found(mocker):
+def test_delete_meal_not_found(mock_cursor):
     """Test deleting a meal that does not exist."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.fetchone.return_value = None
-    
+    mock_cursor.fetchone.return_value = None
+
     with pytest.raises(ValueError, match="Meal with ID 1 not found"):
         delete_meal(1)
 
 
-def test_clear_meals(mocker):
+def test_clear_meals(mock_cursor, mocker):
     """Test clearing all meals."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    
+    mocker.patch('builtins.open', mocker.mock_open(read_data="CREATE TABLE meals (id INTEGER);"))
+
     clear_meals()
-    
+
     # Ensure that the create table script was executed
-    with open("mock_path", "r") as file:
-        mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.executescript.assert_called_once()
+    mock_cursor.executescript.assert_called_once_with("CREATE TABLE meals (id INTEGER);")
 
 
-def test_get_leaderboard(mocker):
+def test_get_leaderboard(mock_cursor):
     """Test retrieving the leaderboard."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value
-    
     # Mock the data returned by the database
     mock_cursor.fetchall.return_value = [
         (1, 'Pizza', 'Italian', 10.0, 'MED', 5, 3, 0.6),
@@ -88,60 +96,50 @@ def test_get_leaderboard(mocker):
     ]
 
     leaderboard = get_leaderboard()
-    
+
     assert len(leaderboard) == 2
     assert leaderboard[0]['meal'] == 'Pizza'
     assert leaderboard[1]['meal'] == 'Sushi'
 
 
-def test_get_meal_by_id(meal, mocker):
+def test_get_meal_by_id(meal, mock_cursor):
     """Test retrieving a meal by ID."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value
     mock_cursor.fetchone.return_value = (meal.id, meal.meal, meal.cuisine, meal.price, meal.difficulty, False)
 
     retrieved_meal = get_meal_by_id(meal.id)
-    
+
     assert retrieved_meal.id == meal.id
     assert retrieved_meal.meal == meal.meal
 
 
-def test_get_meal_by_id_not_found(mocker):
+def test_get_meal_by_id_not_found(mock_cursor):
     """Test retrieving a meal by ID that does not exist."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value
     mock_cursor.fetchone.return_value = None
 
     with pytest.raises(ValueError, match="Meal with ID 1 not found"):
         get_meal_by_id(1)
 
 
-def test_get_meal_by_name(meal, mocker):
+def test_get_meal_by_name(meal, mock_cursor):
     """Test retrieving a meal by name."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value
     mock_cursor.fetchone.return_value = (meal.id, meal.meal, meal.cuisine, meal.price, meal.difficulty, False)
 
     retrieved_meal = get_meal_by_name(meal.meal)
-    
+
     assert retrieved_meal.id == meal.id
     assert retrieved_meal.meal == meal.meal
 
 
-def test_get_meal_by_name_not_found(mocker):
+def test_get_meal_by_name_not_found(mock_cursor):
     """Test retrieving a meal by name that does not exist."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value
     mock_cursor.fetchone.return_value = None
 
     with pytest.raises(ValueError, match="Meal with name Pizza not found"):
         get_meal_by_name('Pizza')
 
 
-def test_update_meal_stats_win(meal, mocker):
+def test_update_meal_stats_win(meal, mock_cursor):
     """Test updating meal stats for a win."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value
     mock_cursor.fetchone.return_value = (False,)
 
     update_meal_stats(meal.id, 'win')
@@ -149,10 +147,8 @@ def test_update_meal_stats_win(meal, mocker):
     mock_cursor.execute.assert_called_with("UPDATE meals SET battles = battles + 1, wins = wins + 1 WHERE id = ?", (meal.id,))
 
 
-def test_update_meal_stats_loss(meal, mocker):
+def test_update_meal_stats_loss(meal, mock_cursor):
     """Test updating meal stats for a loss."""
-    mock_get_db_connection = mocker.patch('meal_max.utils.sql_utils.get_db_connection', return_value=mock.Mock())
-    mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value
     mock_cursor.fetchone.return_value = (False,)
 
     update_meal_stats(meal.id, 'loss')
@@ -160,7 +156,17 @@ def test_update_meal_stats_loss(meal, mocker):
     mock_cursor.execute.assert_called_with("UPDATE meals SET battles = battles + 1 WHERE id = ?", (meal.id,))
 
 
-def test_update_meal_stats_invalid_result(meal, mocker):
+def test_update_meal_stats_invalid_result(meal, mock_cursor):
     """Test updating meal stats with an invalid result."""
+    mock_cursor.fetchone.return_value = (False,)
+
     with pytest.raises(ValueError, match="Invalid result: INVALID. Expected 'win' or 'loss'."):
         update_meal_stats(meal.id, 'INVALID')
+
+
+def test_update_meal_stats_pair(mock_cursor):
+    """Test updating stats for a winner and loser in a single statement."""
+    update_meal_stats_pair(1, 2)
+
+    args = mock_cursor.execute.call_args
+    assert args[0][1] == (1, 1, 2)
@@ -1,11 +1,19 @@
 import pytest
 import requests
 
+from meal_max.utils import random_utils
 from meal_max.utils.random_utils import get_random
 
 
 RANDOM_NUMBER = 0.42
 
+@pytest.fixture(autouse=True)
+def clear_random_cache():
+    """Start each test with an empty random-number cache so every test fetches."""
+    random_utils._cache.clear()
+    yield
+    random_utils._cache.clear()
+
 @pytest.fixture
 def mock_random_org(mocker):
     # Patch the requests.get call
@@ -24,8 +32,22 @@ def test_get_random(mock_random_org):
     # Assert that the result is the mocked random number
     assert result == RANDOM_NUMBER, f"Expected random number {RANDOM_NUMBER}, but got {result}"
 
-    # Ensure that the correct URL was called
-    requests.get.assert_called_once_with("https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new", timeout=5)
+    # Ensure that the correct batched URL was called
+    requests.get.assert_called_once_with(
+        f"https://www.random.org/decimal-fractions/?num={random_utils._BATCH_SIZE}&dec=2&col=1&format=plain&rnd=new",
+        timeout=5,
+    )
+
+def test_get_random_served_from_cache(mock_random_org):
+    """Test that a batched response serves later calls without a new request."""
+    mock_random_org.text = "0.10\n0.20\n0.30"
+
+    assert get_random() == 0.10
+    assert get_random() == 0.20
+    assert get_random() == 0.30
+
+    # Only the first call should have hit random.org
+    requests.get.assert_called_once()
 
 def test_get_random_request_failure(mocker):
     """Simulate a request failure."""